@@ -31,6 +31,19 @@ float stable_distance_mm = -1.0, stable_force_N = 0.0;
 unsigned long lastSendTime = 0;
 const unsigned long SEND_INTERVAL = 100;
 
+// --- 二进制数据帧：1 字节同步头 + 3 个 float (力, 距离, 压力，AVR 上为小端 IEEE754)
+//     + 1 字节 CRC-8 校验 (多项式 0x07，覆盖 12 个载荷字节) ---
+const byte FRAME_SYNC = 0xAA;
+
+byte crc8(const byte *data, unsigned int len) {
+  byte crc = 0;
+  for (unsigned int i = 0; i < len; ++i) {
+    crc ^= data[i];
+    for (byte bit = 0; bit < 8; ++bit) crc = (crc & 0x80) ? (crc << 1) ^ 0x07 : crc << 1;
+  }
+  return crc;
+}
+
 void setup() {
   Serial.begin(9600);
   irSensorSerial.begin(115200);
@@ -68,12 +81,11 @@ void sendAllData() {
     }
     return;
   }
-  float current_pressure = processPressureSensor();
-  Serial.print(stable_force_N, 2);
-  Serial.print(",");
-  Serial.print(stable_distance_mm, 2);
-  Serial.print(",");
-  Serial.println(current_pressure, 3);
+  float frame[3] = { stable_force_N, stable_distance_mm, processPressureSensor() };
+  const byte *payload = (const byte *)frame;
+  Serial.write(FRAME_SYNC);
+  Serial.write(payload, sizeof(frame));
+  Serial.write(crc8(payload, sizeof(frame)));
 }
 
 void processForceSensor() {
@@ -6,18 +6,38 @@
 import serial
 import threading
 import time
-import queue
-from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment
-from openpyxl.utils import get_column_letter
+import numpy as np
 import os
-import statistics
+import math
+import zipfile
+from xml.sax.saxutils import escape
+from itertools import chain, zip_longest
+import sys
+if os.name == 'nt':
+    import msvcrt
+else:
+    import select
 
 # ==============================================================================
 # --- 1. 配置区 ---
 # ==============================================================================
 SERIAL_PORT = 'COM3'
 BAUD_RATE = 9600
+# 等待 Arduino “准备就绪” 信号的最长时间 (秒)
+HANDSHAKE_TIMEOUT = 10
+# Windows 下串口驱动的接收缓冲区大小 (字节)
+SERIAL_RX_BUFFER_SIZE = 65536
+
+# --- 串口二进制数据帧：1 字节同步头 0xAA + 3 个小端 float32 (力, 距离, 压力)
+#     + 1 字节 CRC-8 校验 (多项式 0x07，覆盖 12 个载荷字节)，共 14 字节 ---
+# 异或/求和校验对循环移位不敏感，错位锁定在重复出现的 0xAA 载荷字节上时仍会通过，故用 CRC
+FRAME_SYNC = 0xAA
+FRAME_PAYLOAD = np.dtype('<f4')
+FRAME_PAYLOAD_SIZE = 3 * FRAME_PAYLOAD.itemsize
+FRAME_SIZE = 1 + FRAME_PAYLOAD_SIZE + 1
+
+# --- 环形样本缓冲区容量：消费者落后超过此数量时丢弃最旧的样本 ---
+SAMPLE_BUFFER_SIZE = 200
 
 # --- 目标压力提示列表 ---
 TARGET_PRESSURES = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6]
@@ -32,30 +52,115 @@ OUTPUT_FILENAME = os.path.join(desktop_path, f"structured_experiment_{int(time.t
 # --- 2. 全局变量 ---
 # ==============================================================================
 stop_all_threads = threading.Event()
-data_queue = queue.Queue()
+# 预分配的环形缓冲区，每行一个样本 (力, 距离, 压力)；
+# ring_head 为已写入的样本总数 (只由读取线程推进)，ring_tail 为消费者已取到的位置
+sample_ring = np.empty((SAMPLE_BUFFER_SIZE, 3), dtype=np.float32)
+ring_head = [0]
+ring_tail = [0]
+data_cv = threading.Condition()
+# 读取线程写入的最新样本 (力, 距离, 压力)，显示线程只读此槽位，不接触缓冲区
+latest_sample = [None]
 
 # ==============================================================================
 # --- 3. 功能函数定义 ---
 # ==============================================================================
 
+def publish_samples(samples):
+    """读取线程调用：将 (k, 3) 的新样本整批写入环形缓冲区并唤醒消费者。"""
+    samples = samples[-SAMPLE_BUFFER_SIZE:]
+    latest_sample[0] = tuple(samples[-1].tolist())
+    with data_cv:
+        head = ring_head[0]
+        idx = (head + np.arange(len(samples))) % SAMPLE_BUFFER_SIZE
+        sample_ring[idx] = samples
+        ring_head[0] = head + len(samples)
+        data_cv.notify()
+
+def take_samples(timeout):
+    """
+    取出自上次以来的全部新样本，返回 (k, 3) 的 float32 数组；
+    没有新样本时最多等待 timeout 秒，超时返回空数组。
+    """
+    with data_cv:
+        data_cv.wait_for(lambda: ring_head[0] > ring_tail[0], timeout)
+        head = ring_head[0]
+        tail = max(ring_tail[0], head - SAMPLE_BUFFER_SIZE)
+        ring_tail[0] = head
+        start, stop = tail % SAMPLE_BUFFER_SIZE, head % SAMPLE_BUFFER_SIZE
+        if start < stop or head == tail:
+            return sample_ring[start:stop].copy()
+        # 跨越缓冲区末尾时分两段拼接
+        return np.concatenate((sample_ring[start:], sample_ring[:stop]))
+
+def drain_samples():
+    """丢弃缓冲区中尚未取走的全部样本：一次加锁，把消费位置直接移到写入位置。"""
+    with data_cv:
+        ring_tail[0] = ring_head[0]
+
+def enter_pressed():
+    """非阻塞地检查用户是否已按下 Enter (Windows 用 msvcrt，其他系统用 select)。"""
+    if os.name == 'nt':
+        while msvcrt.kbhit():
+            if msvcrt.getwch() in ('\r', '\n'):
+                return True
+        return False
+    if select.select([sys.stdin], [], [], 0)[0]:
+        sys.stdin.readline()
+        return True
+    return False
+
+def _build_crc8_table(poly=0x07):
+    """生成 CRC-8 查表 (逐字节查表计算时使用)。"""
+    table = np.zeros(256, dtype=np.uint8)
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) & 0xFF if crc & 0x80 else (crc << 1) & 0xFF
+        table[byte] = crc
+    return table
+
+CRC8_TABLE = _build_crc8_table()
+
+def frame_crc8(payload_bytes):
+    """对 (k, FRAME_PAYLOAD_SIZE) 的 uint8 数组逐列查表，一次算出 k 个帧的 CRC-8。"""
+    crc = np.zeros(len(payload_bytes), dtype=np.uint8)
+    for col in range(payload_bytes.shape[1]):
+        crc = CRC8_TABLE[crc ^ payload_bytes[:, col]]
+    return crc
+
 def serial_reader_thread(ser):
-    """后台线程：持续从串口读取数据并放入队列。"""
+    """后台线程：持续从串口读取二进制数据帧，解析后放入样本缓冲区。"""
+    pending = bytearray()
     while not stop_all_threads.is_set():
         try:
-            line = ser.readline().decode('utf-8').strip()
-            if line:
-                parts = line.split(',')
-                if len(parts) == 3:
-                    data_tuple = tuple(map(float, parts))
-                    if data_queue.qsize() > 100:
-                        data_queue.get()
-                    data_queue.put(data_tuple)
+            # 一次读走驱动中已到达的全部字节；空闲时至少等待一整帧
+            pending += ser.read(max(FRAME_SIZE, ser.in_waiting))
         except (serial.SerialException, OSError, TypeError):
             print("\n串口错误，读取线程退出。")
             stop_all_threads.set()
             break
-        except (ValueError, IndexError, UnicodeDecodeError):
-            continue
+        offset = 0
+        while len(pending) - offset >= FRAME_SIZE:
+            if pending[offset] != FRAME_SYNC:
+                # 帧未对齐，逐字节向后寻找同步头
+                offset += 1
+                continue
+            # 从对齐位置起的所有完整帧一次性校验，遇到第一个无效帧为止
+            count = (len(pending) - offset) // FRAME_SIZE
+            frames = np.frombuffer(bytes(pending[offset:offset + count * FRAME_SIZE]), dtype=np.uint8)
+            frames = frames.reshape(count, FRAME_SIZE)
+            payload_bytes = frames[:, 1:1 + FRAME_PAYLOAD_SIZE]
+            valid = (frames[:, 0] == FRAME_SYNC) & (frame_crc8(payload_bytes) == frames[:, -1])
+            if not valid[0]:
+                # 0xAA 实为载荷中的字节或帧已损坏，后移一字节重新寻找同步头
+                offset += 1
+                continue
+            if not valid.all():
+                count = int(np.argmin(valid))
+            payload = np.ascontiguousarray(payload_bytes[:count]).view(FRAME_PAYLOAD)
+            publish_samples(payload.astype(np.float32, copy=False))
+            offset += count * FRAME_SIZE
+        del pending[:offset]
 
 def perform_offset_calibration():
     """步骤一：进行初始长度的校准。"""
@@ -68,22 +173,26 @@ def perform_offset_calibration():
         except ValueError:
             print("输入无效。")
     input(f"\n已设置真实初始长度为 {real_initial_length:.2f} mm。\n请将物体放置在该初始位置，然后按 [Enter] 键开始测量传感器读数...")
-    while not data_queue.empty(): data_queue.get()
+    drain_samples()
     calibration_duration = 5
     collected_distances = []
     print("正在测量传感器读数...")
-    start_time = time.time()
-    while time.time() - start_time < calibration_duration:
-        try:
-            _, distance, _ = data_queue.get(timeout=2.0)
-            collected_distances.append(distance)
-            time_left = calibration_duration - (time.time() - start_time)
-            print(f"\r采集中... 剩余 {time_left:.1f} 秒", end="")
-        except queue.Empty:
+    deadline = time.monotonic() + calibration_duration
+    last_print = 0.0
+    now = time.monotonic()
+    while now < deadline:
+        samples = take_samples(timeout=2.0)
+        if not len(samples):
             print("\n警告：校准期间未收到数据。"); break
+        collected_distances.append(samples[:, 1])
+        now = time.monotonic()
+        # 剩余时间提示限频到约 10 Hz
+        if now - last_print > 0.1:
+            last_print = now
+            print(f"\r采集中... 剩余 {max(deadline - now, 0.0):.1f} 秒", end="")
     if not collected_distances:
         print("\n错误：校准失败，未收集到任何数据。"); return None, None
-    sensor_measured_distance = statistics.mean(collected_distances)
+    sensor_measured_distance = float(np.concatenate(collected_distances).mean(dtype=np.float64))
     calibration_offset = real_initial_length - sensor_measured_distance
     print(f"\n\n校准完成！传感器在初始位置的平均读数为: {sensor_measured_distance:.2f} mm")
     print(f"计算出的校准偏移量为: {calibration_offset:.2f} mm")
@@ -122,19 +231,15 @@ def detect_and_lock_pressure():
     def pressure_display_thread():
         # 在新线程中刷新压力
         while not stop_pressure_display.is_set():
-            try:
-                # 只看不取，或者快速取用
-                _, _, current_pressure = data_queue.get(timeout=0.1)
+            # 只读最新样本槽位，不从缓冲区取数据
+            sample = latest_sample[0]
+            if sample is not None:
                 # 使用 \r 在同一行更新
-                print(f"\r请调节气压至 {locked_target} MPa 附近... 当前压力: {current_pressure:.3f} MPa", end="")
-            except queue.Empty:
-                # 队列为空时，短暂休眠，避免CPU空转
-                time.sleep(0.05)
+                print(f"\r请调节气压至 {locked_target} MPa 附近... 当前压力: {sample[2]:.3f} MPa", end="")
+            time.sleep(0.05)
     
     print(f"\n已设定目标压力为 {locked_target} MPa。")
-    # 清空旧数据，准备开始显示实时压力
-    while not data_queue.empty(): data_queue.get()
-    
+
     # 启动压力显示线程
     display_thread = threading.Thread(target=pressure_display_thread)
     display_thread.daemon = True # 设置为守护线程，主程序退出时它也退出
@@ -150,8 +255,8 @@ def detect_and_lock_pressure():
     # 结束后打印一个换行，让后续输出在新的一行开始
     print() 
 
-    # 再次清空队列，确保数据采集从一个干净的状态开始
-    while not data_queue.empty(): data_queue.get()
+    # 清空调节期间积累的样本，确保数据采集从一个干净的状态开始
+    drain_samples()
         
     return locked_target
 # ===========================================================================
@@ -161,68 +266,156 @@ def collect_data_for_session(real_initial_length, calibration_offset):
     session_data = []
     print("\n--- 步骤 3: 数据采集 ---")
     print(">>> 数据采集中... 按 [Enter] 结束当前测量。")
-    
-    stop_collecting_flag = threading.Event()
-    def wait_for_enter():
-        input()
-        stop_collecting_flag.set()
 
-    input_thread = threading.Thread(target=wait_for_enter)
-    input_thread.start()
-    
-    while not stop_collecting_flag.is_set():
-        try:
-            force, sensor_dist, pressure = data_queue.get(timeout=2.0)
-            calibrated_dist = sensor_dist + calibration_offset
-            shrinkage = (-(calibrated_dist - real_initial_length) / real_initial_length) * 100.0
-            
-            force_str = f"力: {force:6.2f} N"
-            shrink_str = f"收缩率: {shrinkage:6.2f} %"
-            pressure_str = f"实时压力: {pressure:5.3f} MPa"
-            print(f"\r{force_str}  |  {shrink_str}  |  {pressure_str}   ", end="")
-            
-            session_data.append((force, shrinkage))
-        except queue.Empty:
-            time.sleep(0.01)
+    last_print = 0.0
+    # 每轮循环非阻塞地检查一次 Enter，无需单独的输入线程
+    while not enter_pressed():
+        # 批量取出当前所有样本，整批计算收缩率
+        samples = take_samples(timeout=0.1)
+        if not len(samples):
             continue
-            
+        calibrated_dist = samples[:, 1].astype(np.float64) + calibration_offset
+        shrinkage = (-(calibrated_dist - real_initial_length) / real_initial_length) * 100.0
+        # 力按原文本协议的精度保留两位小数，避免 float32 尾数噪声写入表格
+        force = np.round(samples[:, 0].astype(np.float64), 2)
+        session_data.extend(zip(force.tolist(), shrinkage.tolist()))
+
+        # 状态行限频到约 20 Hz，只显示最新一个样本
+        now = time.monotonic()
+        if now - last_print > 0.05:
+            last_print = now
+            force_str = f"力: {samples[-1, 0]:6.2f} N"
+            shrink_str = f"收缩率: {shrinkage[-1]:6.2f} %"
+            pressure_str = f"实时压力: {samples[-1, 2]:5.3f} MPa"
+            print(f"\r{force_str}  |  {shrink_str}  |  {pressure_str}   ", end="")
+
     print("\n--- 采集结束 ---")
-    input_thread.join()
     return session_data
 
+# --- xlsx 文件中除工作表外的固定部件 ---
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+XLSX_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="实验数据" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '</Relationships>'
+)
+# 单元格样式编号 (对应 XLSX_STYLES 中 cellXfs 的顺序)，0 为默认样式
+STYLE_HEADER = 1          # 加粗：列名
+STYLE_PRESSURE_TITLE = 2  # 加粗居中：气压标题
+STYLE_SHEET_TITLE = 3     # 加粗 16 号：表格标题
+XLSX_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="3">'
+    '<font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="16"/><name val="Calibri"/></font>'
+    '</fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="4">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1" applyAlignment="1">'
+    '<alignment horizontal="center" vertical="center"/></xf>'
+    '<xf numFmtId="0" fontId="2" fillId="0" borderId="0" xfId="0" applyFont="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+def column_letter(col_idx):
+    """将从 1 开始的列号转换为 Excel 列字母 (1 -> A, 27 -> AA)。"""
+    letters = ""
+    while col_idx > 0:
+        col_idx, rem = divmod(col_idx - 1, 26)
+        letters = chr(ord('A') + rem) + letters
+    return letters
+
 def save_to_excel(filename, data):
-    """将所有采集到的数据分列保存到Excel文件中。"""
+    """将所有采集到的数据分列保存到Excel文件中（直接生成 xlsx 内部的 XML，不依赖 openpyxl）。"""
     if not data:
         print("没有采集到任何数据，无需保存。")
         return
     print(f"\n正在保存数据到 {filename} ...")
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "实验数据"
-    header_font = Font(bold=True)
-    center_alignment = Alignment(horizontal='center', vertical='center')
     pressures_keys = sorted(data.keys())
-    ws.cell(row=1, column=1, value="实验数据记录").font = Font(bold=True, size=16)
+    ncols = len(pressures_keys) * 2
     header_row = 2
-    
-    for col_idx, pressure_key in enumerate(pressures_keys):
-        start_col = col_idx * 2 + 1
-        title_cell = ws.cell(row=header_row, column=start_col, value=f"气压: {pressure_key} MPa")
-        title_cell.font = header_font
-        title_cell.alignment = center_alignment
-        ws.merge_cells(start_row=header_row, start_column=start_col, end_row=header_row, end_column=start_col + 1)
-        ws.cell(row=header_row + 1, column=start_col, value="力 (N)").font = header_font
-        ws.cell(row=header_row + 1, column=start_col + 1, value="收缩率 (%)").font = header_font
-        records = data[pressure_key]
-        for row_idx, (force, shrinkage) in enumerate(records):
-            ws.cell(row=header_row + 2 + row_idx, column=start_col, value=force)
-            ws.cell(row=header_row + 2 + row_idx, column=start_col + 1, value=shrinkage)
-            
-    for col_idx in range(1, len(pressures_keys) * 2 + 2):
-        ws.column_dimensions[get_column_letter(col_idx)].width = 25
-        
+    letters = [column_letter(col_idx) for col_idx in range(1, ncols + 1)]
+    # 每列数据单元格的固定前缀，行循环中只需拼接行号和数值
+    cell_prefixes = [f'<c r="{letter}' for letter in letters]
+
+    def text_cell(ref, text, style):
+        return f'<c r="{ref}" s="{style}" t="inlineStr"><is><t>{escape(text)}</t></is></c>'
+
     try:
-        wb.save(filename)
+        with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+            zf.writestr('[Content_Types].xml', XLSX_CONTENT_TYPES)
+            zf.writestr('_rels/.rels', XLSX_ROOT_RELS)
+            zf.writestr('xl/workbook.xml', XLSX_WORKBOOK)
+            zf.writestr('xl/_rels/workbook.xml.rels', XLSX_WORKBOOK_RELS)
+            zf.writestr('xl/styles.xml', XLSX_STYLES)
+
+            with zf.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+                def write(text):
+                    sheet.write(text.encode('utf-8'))
+
+                write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                      '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                      f'<cols><col min="1" max="{ncols + 1}" width="25" customWidth="1"/></cols>'
+                      '<sheetData>')
+                write(f'<row r="1">{text_cell("A1", "实验数据记录", STYLE_SHEET_TITLE)}</row>')
+                title_cells, column_cells = [], []
+                for col_idx, pressure_key in enumerate(pressures_keys):
+                    force_col, shrink_col = letters[col_idx * 2], letters[col_idx * 2 + 1]
+                    title_cells.append(text_cell(f"{force_col}{header_row}", f"气压: {pressure_key} MPa", STYLE_PRESSURE_TITLE))
+                    column_cells.append(text_cell(f"{force_col}{header_row + 1}", "力 (N)", STYLE_HEADER))
+                    column_cells.append(text_cell(f"{shrink_col}{header_row + 1}", "收缩率 (%)", STYLE_HEADER))
+                write(f'<row r="{header_row}">{"".join(title_cells)}</row>')
+                write(f'<row r="{header_row + 1}">{"".join(column_cells)}</row>')
+
+                # 数据行：每行按压力档依次填入 (力, 收缩率)，较短的档位留空
+                rows = zip_longest(*(data[key] for key in pressures_keys), fillvalue=(None, None))
+                isfinite = math.isfinite
+                for row_idx, records in enumerate(rows, start=header_row + 2):
+                    row_ref = f'{row_idx}"><v>'
+                    cells = "".join(
+                        f'{prefix}{row_ref}{value!r}</v></c>'
+                        for prefix, value in zip(cell_prefixes, chain.from_iterable(records))
+                        if value is not None and isfinite(value)
+                    )
+                    write(f'<row r="{row_idx}">{cells}</row>')
+
+                merges = "".join(
+                    f'<mergeCell ref="{letters[col_idx]}{header_row}:{letters[col_idx + 1]}{header_row}"/>'
+                    for col_idx in range(0, ncols, 2)
+                )
+                write(f'</sheetData><mergeCells count="{len(pressures_keys)}">{merges}</mergeCells></worksheet>')
         print(f"成功！数据已保存到 {filename}")
     except Exception as e:
         print(f"保存文件失败: {e}")
@@ -235,17 +428,21 @@ def main():
     all_sessions_data = {}
     try:
         ser = serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=5)
+        if sys.platform == 'win32':
+            ser.set_buffer_size(rx_size=SERIAL_RX_BUFFER_SIZE)
         print(f"成功连接到串口 {SERIAL_PORT}。")
         print("正在等待Arduino的“准备就绪”信号...")
+        # 板子未复位时收到的可能是二进制数据帧：忽略无法解码的字节，跳过其他内容直到超时
+        handshake_deadline = time.monotonic() + HANDSHAKE_TIMEOUT
         handshake_received = False
         while not handshake_received:
-            line = ser.readline().decode('utf-8').strip()
+            if time.monotonic() > handshake_deadline:
+                print("错误：等待握手信号超时。程序退出。")
+                return
+            line = ser.read_until(b'\n', size=128).decode('utf-8', errors='ignore').strip()
             if line == "Arduino is Ready":
                 handshake_received = True
                 print("握手成功！Arduino已准备就绪。")
-            elif not line:
-                print("错误：等待握手信号超时。程序退出。")
-                return
         
         ser.reset_input_buffer()
         reader_thread = threading.Thread(target=serial_reader_thread, args=(ser,))
@@ -1,12 +1,20 @@
-import pandas as pd
 import numpy as np
+import openpyxl
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import seaborn as sns
-from scipy.signal import savgol_filter
-from rdp import rdp
+from scipy.signal import savgol_coeffs
+from scipy.ndimage import convolve1d
 import os
 import re
 
+# numba 为可选依赖：安装后分组统计使用编译后的单次遍历内核
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 # ==============================================================================
 # --- 1. 配置区 (请在此处修改) ---
 # ==============================================================================
@@ -41,44 +49,190 @@ except:
 # --- 2. 核心功能函数 (无需修改) ---
 # ==============================================================================
 
-def preprocess_data(x, y, num_bins):
+# 从 '气压: 0.1 MPa' 之类的标题中提取数值标签
+PRESSURE_LABEL_PATTERN = re.compile(r'[\d\.]+')
+
+def _bin_sums_numpy(x, y, num_bins):
+    """
+    统计各组的点数与 x、y 之和，返回 counts 与 (2, num_bins) 的 sums。
+    组内求和与点的顺序无关，因此无需先排序，只需 x 的范围。
+    """
+    bins = np.linspace(x.min(), x.max(), num_bins + 1)
+    # 每个点所属的分组下标 (0 ~ num_bins-1)：只在内部边界上查找，最大值自然落入最后一组
+    idx = np.searchsorted(bins[1:-1], x, side='right')
+    counts = np.bincount(idx, minlength=num_bins)
+    sums = np.empty((2, num_bins))
+    sums[0] = np.bincount(idx, weights=x, minlength=num_bins)
+    sums[1] = np.bincount(idx, weights=y, minlength=num_bins)
+    return counts, sums
+
+def _bin_sums_loop(x, y, num_bins):
+    """
+    与 _bin_sums_numpy 相同，但只对数据单次遍历，供 numba 编译。
+    """
+    lo, hi = x.min(), x.max()
+    scale = num_bins / (hi - lo) if hi > lo else 0.0
+    counts = np.zeros(num_bins, dtype=np.int64)
+    sums = np.zeros((2, num_bins))
+    for i in range(x.shape[0]):
+        k = min(int((x[i] - lo) * scale), num_bins - 1)
+        counts[k] += 1
+        sums[0, k] += x[i]
+        sums[1, k] += y[i]
+    return counts, sums
+
+_bin_sums_kernel = njit(cache=True, fastmath=True)(_bin_sums_loop) if njit is not None else _bin_sums_numpy
+
+def bin_sums(x, y, num_bins):
+    """
+    统计各组的点数与 x、y 之和 (numba 可用时使用编译内核)。
+    编译后的内核不做越界检查，因此先确认 x、y 等长。
+    """
+    if len(x) != len(y):
+        raise ValueError(f"x 与 y 长度不一致: {len(x)} != {len(y)}")
+    return _bin_sums_kernel(x, y, num_bins)
+
+def build_savgol_operators(window_length, polyorder):
+    """
+    预先计算 Savitzky-Golay 滤波的卷积核以及两端的多项式拟合矩阵，
+    所有数据系列共用，不必每次滤波都重新求解最小二乘。
+    """
+    kernel = savgol_coeffs(window_length, polyorder)
+    halflen = window_length // 2
+    # 两端 halflen 个点用窗口内的多项式拟合值代替 (等价于 savgol_filter 的 mode='interp')
+    fit = np.linalg.pinv(np.vander(np.arange(window_length), polyorder + 1))
+    left = np.vander(np.arange(halflen), polyorder + 1) @ fit
+    right = np.vander(np.arange(window_length - halflen, window_length), polyorder + 1) @ fit
+    return kernel, left, right
+
+def apply_savgol(series, operators, output=None):
+    """
+    沿最后一维平滑 series，结果与 savgol_filter(mode='interp') 一致。
+    可传入 (2, N) 数组，一次卷积同时平滑两个序列；给定 output 时结果直接写入其中。
+    """
+    kernel, left, right = operators
+    window_length, halflen = len(kernel), len(left)
+    smoothed = convolve1d(series, kernel, axis=-1, mode='constant', output=output)
+    smoothed[..., :halflen] = series[..., :window_length] @ left.T
+    smoothed[..., -halflen:] = series[..., -window_length:] @ right.T
+    return smoothed
+
+def preprocess_and_smooth(x, y, num_bins, sg_operators):
+    """
+    对原始数据进行“排序-分组-平均”预处理，消除噪声和数据分支，
+    并直接在分组结果上做 Savitzky-Golay 平滑。全程使用 float32。
+    返回 (n, 2) 的平滑点数组；分组后点数不足滤波窗口时返回 None。
+    """
+    window_length = len(sg_operators[0])
+    x, y = np.asarray(x, dtype=np.float32), np.asarray(y, dtype=np.float32)
+    # 与原先 zip(x, y) 一致：长度不一致时按较短的一列截断
+    n = min(len(x), len(y))
+    x, y = x[:n], y[:n]
+    if len(x) < 2:
+        n = len(x)
+    else:
+        counts, sums = bin_sums(x, y, num_bins)
+        mask = counts > 0
+        n = int(np.count_nonzero(mask))
+    if n < window_length:
+        print(f"警告：预处理后数据点 ({n}) 少于SG滤波器窗口 ({window_length})，跳过此压力档。")
+        return None
+
+    # 各组之和写入同一块 (2, n) 缓冲区后原地求平均，空组直接丢弃
+    binned = sums[:, mask].astype(np.float32)
+    binned /= counts[mask]
+
+    # 平滑结果直接按列写入预分配的 (n, 2) 点数组
+    smooth_points = np.empty((n, 2), dtype=np.float32)
+    apply_savgol(binned, sg_operators, output=smooth_points.T)
+    return smooth_points
+
+def rdp_iter(points, epsilon):
+    """
+    迭代版 Ramer-Douglas-Peucker 算法：用显式栈代替递归，
+    每一段的点到线距离用 NumPy 一次性算出。
+    """
+    n = len(points)
+    if n < 3: return points
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < 2: continue
+        start, end = points[lo], points[hi]
+        seg = end - start
+        rel = points[lo + 1:hi] - start
+        seg_len = np.hypot(seg[0], seg[1])
+        if seg_len > 0:
+            # 二维叉积的绝对值 / 线段长度 = 点到直线的垂直距离
+            d = np.abs(seg[0] * rel[:, 1] - seg[1] * rel[:, 0]) / seg_len
+        else:
+            d = np.hypot(rel[:, 0], rel[:, 1])
+        k = int(np.argmax(d))
+        if d[k] > epsilon:
+            mid = lo + 1 + k
+            keep[mid] = True
+            stack.append((lo, mid))
+            stack.append((mid, hi))
+    return points[keep]
+
+def to_float(value):
+    """
+    将单元格值转换为浮点数；空单元格、布尔值和非数字文本返回 nan，
+    效果与 pd.to_numeric(errors='coerce') 相同。
+    """
+    if isinstance(value, bool):
+        return np.nan
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return np.nan
+
+def to_float_pairs(rows):
     """
-    对原始数据进行“排序-分组-平均”预处理，消除噪声和数据分支。
+    将逐行的 (力, 收缩率) 单元格对转换为两个等长的 float32 数组。
+    只要有一个单元格不是数字就整行丢弃，保证两列始终逐行配对。
     """
-    if len(x) < 2: return x, y
-    points = sorted(zip(x, y))
-    x_sorted, y_sorted = np.array(list(zip(*points)))
-    bins = np.linspace(x_sorted[0], x_sorted[-1], num_bins + 1)
-    digitized = np.digitize(x_sorted, bins)
-    x_binned = [x_sorted[digitized == i].mean() for i in range(1, len(bins))]
-    y_binned = [y_sorted[digitized == i].mean() for i in range(1, len(bins))]
-    x_processed = np.array([val for val in x_binned if not np.isnan(val)])
-    y_processed = np.array([val for val in y_binned if not np.isnan(val)])
-    return x_processed, y_processed
+    pairs = np.array([(to_float(force), to_float(shrinkage)) for force, shrinkage in rows], dtype=np.float32)
+    pairs = pairs.reshape(-1, 2)
+    pairs = pairs[~np.isnan(pairs).any(axis=1)]
+    return pairs[:, 0].copy(), pairs[:, 1].copy()
 
-def parse_data_blocks(df):
+def parse_data_blocks(ws):
     """
-    从DataFrame中动态解析出所有数据块。
+    流式扫描工作表，动态解析出所有数据块。
     """
+    # 每列第一个 '气压' 标题单元格 -> (标题行号, 标题, 逐行的 (力, 收缩率) 原始单元格对)
+    blocks = {}
+    for row_idx, row in enumerate(ws.iter_rows(values_only=True), start=1):
+        for col_idx, value in enumerate(row):
+            if col_idx not in blocks and isinstance(value, str) and '气压' in value:
+                blocks[col_idx] = (row_idx, value, [])
+        # 标题下方隔一行（列名行）开始是数据；同一行的两个单元格始终成对保存
+        for col_idx, (title_row, _, data_rows) in blocks.items():
+            if row_idx >= title_row + 2 and col_idx + 1 < len(row):
+                data_rows.append((row[col_idx], row[col_idx + 1]))
+
     data_blocks = {}
-    for c in range(df.shape[1]):
-        pressure_cell = df[c].astype(str).str.contains('气压')
-        if pressure_cell.any():
-            row_idx, col_idx = pressure_cell.idxmax(), c
-            pressure_title = str(df.iat[row_idx, col_idx])
-            
-            # 使用正则表达式从 '气压: 0.1 MPa' 中提取出 '0.1'
-            match = re.search(r'[\d\.]+', pressure_title)
-            clean_label = match.group(0) if match else f"系列{c+1}"
-
-            print(f"\n找到数据块: '{pressure_title}' -> 解析为标签: '{clean_label}'")
-            data_start_row = row_idx + 2
-            force_data = pd.to_numeric(df.iloc[data_start_row:, col_idx], errors='coerce').dropna()
-            shrinkage_data = pd.to_numeric(df.iloc[data_start_row:, col_idx + 1], errors='coerce').dropna()
-            
-            if not force_data.empty and not shrinkage_data.empty:
-                data_blocks[clean_label] = (force_data.values, shrinkage_data.values)
-                print(f"解析成功，找到 {len(force_data)} 个有效数据点。")
+    for col_idx in sorted(blocks):
+        _, pressure_title, data_rows = blocks[col_idx]
+
+        # 使用正则表达式从 '气压: 0.1 MPa' 中提取出 '0.1'
+        match = PRESSURE_LABEL_PATTERN.search(pressure_title)
+        clean_label = match.group(0) if match else f"系列{col_idx+1}"
+
+        print(f"\n找到数据块: '{pressure_title}' -> 解析为标签: '{clean_label}'")
+        # 任一单元格不是数字的行整行丢弃，两列保持等长且逐行配对
+        force_data, shrinkage_data = to_float_pairs(data_rows)
+
+        if force_data.size:
+            data_blocks[clean_label] = (force_data, shrinkage_data)
+            print(f"解析成功，找到 {len(force_data)} 个有效数据点。")
     return data_blocks
 
 # ==============================================================================
@@ -91,13 +245,17 @@ def main_process_and_plot(source_file):
     """
     # --- 步骤 1: 加载并解析数据 ---
     try:
-        raw_df = pd.read_excel(source_file, header=None)
+        # 只读模式逐行流式读取，不构建完整的单元格树
+        wb = openpyxl.load_workbook(source_file, read_only=True, data_only=True)
         print(f"成功加载文件: '{source_file}'")
     except FileNotFoundError:
         print(f"错误: 文件 '{source_file}' 未找到。")
         return
-        
-    data_blocks = parse_data_blocks(raw_df)
+
+    try:
+        data_blocks = parse_data_blocks(wb.active)
+    finally:
+        wb.close()
     if not data_blocks:
         print("\n处理错误：在文件中未能解析出任何有效的数据块。")
         return
@@ -108,45 +266,47 @@ def main_process_and_plot(source_file):
     colors = sns.color_palette(COLOR_PALETTE, n_colors=len(data_blocks))
 
     # --- 步骤 3: 循环处理每个数据块并绘图 ---
+    series_points, series_colors, legend_handles = [], [], []
+    sg_operators = build_savgol_operators(SG_WINDOW_LENGTH, SG_POLYORDER)
+    # 先用极小的数据触发一次 numba 编译 (或读取缓存)，不计入各数据块的处理
+    bin_sums(np.zeros(2, dtype=np.float32), np.zeros(2, dtype=np.float32), 1)
     for i, (label, (force_raw, shrinkage_raw)) in enumerate(data_blocks.items()):
         print(f"\n--- 正在处理: {label} MPa ---")
         
-        # --- 核心升级 1: 数据预处理 (重排) ---
-        print(f"应用'排序-分组-平均'预处理 (分成 {PREPROCESS_BINS} 组)...")
-        force_proc, shrinkage_proc = preprocess_data(force_raw, shrinkage_raw, num_bins=PREPROCESS_BINS)
-        
-        if len(force_proc) < SG_WINDOW_LENGTH:
-            print(f"警告：预处理后数据点 ({len(force_proc)}) 少于SG滤波器窗口 ({SG_WINDOW_LENGTH})，跳过此压力档。")
+        # --- 核心升级 1+2: 数据预处理 (重排) 并在预处理后的数据上进行平滑 ---
+        print(f"应用'排序-分组-平均'预处理 (分成 {PREPROCESS_BINS} 组) 与Savitzky-Golay滤波器...")
+        smooth_points = preprocess_and_smooth(force_raw, shrinkage_raw, PREPROCESS_BINS, sg_operators)
+        if smooth_points is None:
             continue
         
-        # --- 核心升级 2: 在预处理后的数据上进行平滑 ---
-        print(f"应用Savitzky-Golay滤波器...")
-        force_smooth = savgol_filter(force_proc, SG_WINDOW_LENGTH, SG_POLYORDER)
-        shrinkage_smooth = savgol_filter(shrinkage_proc, SG_WINDOW_LENGTH, SG_POLYORDER)
-        
         # --- 保留的优点: 自适应 RDP ---
+        shrinkage_smooth = smooth_points[:, 1]
         shrinkage_range = np.max(shrinkage_smooth) - np.min(shrinkage_smooth)
         dynamic_epsilon = RDP_ADAPTIVE_RATIO * shrinkage_range + 1e-9
         print(f"动态计算 Epsilon: {dynamic_epsilon:.5f}")
         
-        smooth_points = np.column_stack([force_smooth, shrinkage_smooth])
-        key_points = rdp(smooth_points, epsilon=dynamic_epsilon)
+        key_points = rdp_iter(smooth_points, dynamic_epsilon)
         
         force_final, shrinkage_final = key_points.T
         print(f"处理完成！关键点数: {len(force_final)}")
         
-        # --- 核心升级 3: 在同一个图表上绘制最终结果 ---
-        ax.plot(force_final, shrinkage_final, 'o-', 
-                label=label, 
-                color=colors[i], 
-                linewidth=2, 
-                markersize=5)
+        # --- 核心升级 3: 收集各系列的最终结果，循环结束后在同一个图表上统一绘制 ---
+        series_points.append(key_points)
+        series_colors.append(colors[i])
+        legend_handles.append(Line2D([], [], marker='o', label=label, color=colors[i], linewidth=2, markersize=5))
+
+    # 所有折线合成一个 LineCollection，所有标记点合成一次 scatter
+    if series_points:
+        ax.add_collection(LineCollection(series_points, colors=series_colors, linewidths=2))
+        marker_colors = np.repeat(series_colors, [len(points) for points in series_points], axis=0)
+        ax.scatter(*np.concatenate(series_points).T, c=marker_colors, s=5 ** 2, zorder=3)
+        ax.autoscale_view()
 
     # --- 步骤 4: 统一美化最终的图表 ---
     ax.set_title(CHART_TITLE, fontsize=18, weight='bold', pad=20)
     ax.set_xlabel(X_AXIS_LABEL, fontsize=14)
     ax.set_ylabel(Y_AXIS_LABEL, fontsize=14)
-    ax.legend(title=LEGEND_TITLE, fontsize=11, title_fontsize=13)
+    ax.legend(handles=legend_handles, title=LEGEND_TITLE, fontsize=11, title_fontsize=13)
     ax.tick_params(axis='both', which='major', labelsize=12)
     ax.grid(True, which='major', linestyle='--', linewidth=0.5)
     plt.tight_layout()